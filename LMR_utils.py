@@ -2154,7 +2154,7 @@ def validate_config(config):
     psm_keys = list(set([proxy_cfg.proxy_psm_type[p] for p in proxy_types]))
 
     # Forming list of required state variables
-    psmclasses = dict([(name,cls)  for name, cls in list(config.psm.__dict__.items())])
+    psmclasses = dict([(name, getattr(config.psm, name)) for name in psm_keys])
     psm_required_variables = []
     for psm_type in psm_keys:
         #print psm_type, ':', psmclasses[psm_type].psm_required_variables
@@ -81,6 +81,7 @@ Revisions:
 
 from os.path import join
 from copy import deepcopy
+from functools import lru_cache
 import yaml
 import os
 #import matlab.engine
@@ -96,13 +97,54 @@ SRC_DIR = os.path.dirname(os.path.abspath(__file__))
 #   >=4 all)
 LOG_LEVEL = 1
 
+# Every Config() construction derives its file and directory paths from the
+# same few settings; memoize join so each distinct path is built only once.
+_cached_join = lru_cache(maxsize=None)(join)
+
+
+def _precalib_path(lmr_path, use_from_tag, dbversion, avgPeriod,
+                   anom_reference_period, calib_period, *datatags):
+    """
+    Path to the file of pre-calibrated PSMs for the given proxy database tag
+    and calibration data tag(s).  The database version and averaging period
+    are only part of the name for the LMRdb database.
+    """
+    if use_from_tag == 'LMRdb':
+        tags = (use_from_tag, dbversion, avgPeriod) + datatags
+    else:
+        tags = (use_from_tag,) + datatags
+    filename = (f'PSMs_{"_".join(tags)}'
+                f'_ref{anom_reference_period[0]}-{anom_reference_period[1]}'
+                f'_cal{calib_period[0]}-{calib_period[1]}.pckl')
+    return _cached_join(lmr_path, 'PSM', filename)
+
+
 # Class for distinction of configuration classes
 class ConfigGroup(object):
 
+    # Subclasses keep a __dict__ unless they declare their own __slots__
+    __slots__ = ()
+
     def __init__(self, **kwargs):
+        # Snapshot the class-level parameters so that an instance keeps the
+        # values it was built with if the class defaults change afterwards
+        for attr_name, value in self._class_params().items():
+            setattr(self, attr_name, value)
+
         if kwargs:
             update_config_class_yaml(kwargs, self)
 
+    @classmethod
+    def _class_params(cls):
+        """
+        Public class-level parameters of this configuration class.  Nested
+        configuration classes and descriptors are left out.
+        """
+        return {attr_name: value for attr_name, value in vars(cls).items()
+                if not (attr_name.startswith('_') or
+                        isinstance(value, type) or
+                        hasattr(value, '__get__'))}
+
 
 class _YamlStorage(object):
     """
@@ -198,7 +240,6 @@ class wrapper(ConfigGroup):
 
         if self.multi_seed is not None:
             self.multi_seed = list(self.multi_seed)
-        self.iter_range = self.iter_range
         self.param_search = deepcopy(self.param_search)
 
 class core(ConfigGroup):
@@ -306,31 +347,9 @@ class core(ConfigGroup):
 
         # some checks
         if type(self.recon_timescale) != 'int': self.recon_timescale = int(self.recon_timescale)
-        
-        self.nexp = self.nexp
-        self.lmr_path = self.lmr_path
-        self.online_reconstruction = self.online_reconstruction
-        self.clean_start = self.clean_start
-        self.use_precalc_ye = self.use_precalc_ye
-        self.recon_period = self.recon_period
-        self.nens = self.nens
-        self.loc_rad = self.loc_rad
-        self.inflation_fact = self.inflation_fact
-        self.seed = self.seed
-        self.datadir_output = self.datadir_output
-        self.archive_dir = self.archive_dir
-        self.write_posterior_Ye = self.write_posterior_Ye
-        self.anom_reference_period = self.anom_reference_period
-
-        
-        self.save_archive = self.save_archive
-        self.save_archive_percentiles = self.save_archive_percentiles
-        self.save_archive_ens_subsample = self.save_archive_ens_subsample
 
-        
         if self.archive_regrid_method is not None:
             if self.archive_regrid_method == 'esmpy':
-                self.archive_esmpy_interp_method = self.archive_esmpy_interp_method
                 self.archive_esmpy_grid_def = _GridDef.get_info(self.archive_esmpy_regrid_to)
             else:
                 raise ValueError('Unrecognized option for regridding to archive files!'
@@ -533,16 +552,13 @@ class proxies(ConfigGroup):
                 lmr_path = core.lmr_path
 
             if self.datadir_proxy is None:
-                self.datadir_proxy = join(lmr_path, 'data', 'proxies')
-            else:
-                self.datadir_proxy = self.datadir_proxy
+                self.datadir_proxy = _cached_join(lmr_path, 'data', 'proxies')
 
-            self.datafile_proxy = join(self.datadir_proxy,
-                                       self.datafile_proxy)
-            self.metafile_proxy = join(self.datadir_proxy,
-                                       self.metafile_proxy)
+            self.datafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.datafile_proxy)
+            self.metafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.metafile_proxy)
 
-            self.dataformat_proxy = self.dataformat_proxy
             self.regions = list(self.regions)
             self.proxy_resolution = list(self.proxy_resolution)
             self.proxy_timeseries_kind = proxies.proxy_timeseries_kind
@@ -743,19 +759,16 @@ class proxies(ConfigGroup):
                 lmr_path = core.lmr_path
 
             if self.datadir_proxy is None:
-                self.datadir_proxy = join(lmr_path, 'data', 'proxies')
-            else:
-                self.datadir_proxy = self.datadir_proxy
+                self.datadir_proxy = _cached_join(lmr_path, 'data', 'proxies')
 
             self.datafile_proxy = self.datafile_proxy.format(self.dbversion)
             self.metafile_proxy = self.metafile_proxy.format(self.dbversion)
                 
-            self.datafile_proxy = join(self.datadir_proxy,
-                                       self.datafile_proxy)
-            self.metafile_proxy = join(self.datadir_proxy,
-                                       self.metafile_proxy)
+            self.datafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.datafile_proxy)
+            self.metafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.metafile_proxy)
 
-            self.dataformat_proxy = self.dataformat_proxy
             self.regions = list(self.regions)
             self.proxy_resolution = list(self.proxy_resolution)
             self.proxy_timeseries_kind = proxies.proxy_timeseries_kind
@@ -885,19 +898,16 @@ class proxies(ConfigGroup):
                 lmr_path = core.lmr_path
 
             if self.datadir_proxy is None:
-                self.datadir_proxy = join(lmr_path, 'data', 'proxies')
-            else:
-                self.datadir_proxy = self.datadir_proxy
+                self.datadir_proxy = _cached_join(lmr_path, 'data', 'proxies')
 
             self.datafile_proxy = self.datafile_proxy.format(self.dbversion)
             self.metafile_proxy = self.metafile_proxy.format(self.dbversion)
             
-            self.datafile_proxy = join(self.datadir_proxy,
-                                       self.datafile_proxy)
-            self.metafile_proxy = join(self.datadir_proxy,
-                                       self.metafile_proxy)
+            self.datafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.datafile_proxy)
+            self.metafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.metafile_proxy)
 
-            self.dataformat_proxy = self.dataformat_proxy
             self.regions = list(self.regions)
             self.proxy_resolution = list(self.proxy_resolution)
             self.proxy_timeseries_kind = proxies.proxy_timeseries_kind
@@ -928,13 +938,62 @@ class proxies(ConfigGroup):
         super(self.__class__, self).__init__(**kwargs)
         
         self.use_from = list(self.use_from)
-        self.proxy_frac = self.proxy_frac
         if seed is None:
             seed = core.seed
         self.seed = seed
 
 
 
+class _LazyPSM(object):
+    """
+    Class attribute wrapping a nested PSM ConfigGroup so that its instance is
+    only built the first time it is read from a psm instance.  Reading it from
+    the psm class itself returns the nested class, so yaml updates and
+    is_config_class checks see the same thing as before.
+
+    The class defaults and _PSMSettings the nested class is built from are
+    captured by psm.__init__, so the result does not depend on when it is
+    first read.  Its parameters (e.g. datatag_calib) are checked on first
+    access, not when the enclosing Config is built.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.name = cls.__name__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, inst, owner=None):
+        if inst is None:
+            return self.cls
+        value = self.cls(**inst._psm_kwargs[self.name])
+        inst.__dict__[self.name] = value
+        return value
+
+
+class _PSMSettings(object):
+    """
+    Class-level core, proxies and psm parameters read by the PSM
+    configuration classes, captured when a psm instance is created.
+    """
+
+    __slots__ = ('use_from_tag', 'dbversion', 'proxy_timeseries_kind',
+                 'lmr_path', 'anom_reference_period', 'avgPeriod',
+                 'season_source', 'calib_period', 'all_calib_sources')
+
+    def __init__(self):
+        self.use_from_tag = '-'.join(proxies.use_from)
+        self.dbversion = proxies.LMRdb.dbversion
+        self.proxy_timeseries_kind = proxies.proxy_timeseries_kind
+        self.lmr_path = core.lmr_path
+        self.anom_reference_period = core.anom_reference_period
+        self.avgPeriod = psm.avgPeriod
+        self.season_source = psm.season_source
+        self.calib_period = psm.calib_period
+        self.all_calib_sources = deepcopy(psm.all_calib_sources)
+
+
 class psm(ConfigGroup):
     """
     Parameters for PSM classes
@@ -1002,10 +1061,10 @@ class psm(ConfigGroup):
 
         ##** END User Parameters **##
 
-        def __init__(self, lmr_path=None, **kwargs):
+        def __init__(self, lmr_path=None, settings=None, **kwargs):
             super(self.__class__, self).__init__(**kwargs)
-
-            self.datatag_calib = self.datatag_calib
+            if settings is None:
+                settings = _PSMSettings()
 
             dataset_descr = _DataInfo.get_info(self.datatag_calib)
             self.datainfo_calib = dataset_descr['info']
@@ -1013,66 +1072,46 @@ class psm(ConfigGroup):
             self.datafile_calib = dataset_descr['datafile']
             self.dataformat_calib = dataset_descr['dataformat']
 
-            self.psm_r_crit = self.psm_r_crit
-
-            if '-'.join(proxies.use_from) == 'PAGES2kv1' and 'season' in psm.avgPeriod:
+            use_from_tag = settings.use_from_tag
+            if use_from_tag == 'PAGES2kv1' and 'season' in settings.avgPeriod:
                 print('ERROR: Trying to use seasonality information with the PAGES2kv1 proxy records.')
                 print('       No seasonality metadata provided in that dataset. Exiting!')
                 print('       Change avgPeriod to "annual" in your configuration.')
                 raise SystemExit()
 
             if lmr_path is None:
-                lmr_path = core.lmr_path
+                lmr_path = settings.lmr_path
 
             try:
-                if psm.avgPeriod == 'annual':
-                    self.avgPeriod = psm.avgPeriod
-                elif psm.avgPeriod == 'season' and psm.season_source:
-                    if psm.season_source == 'proxy_metadata':
-                        self.avgPeriod = psm.avgPeriod+'META'
-                    elif psm.season_source == 'psm_calib':
-                        self.avgPeriod = psm.avgPeriod+'PSM'
+                if settings.avgPeriod == 'annual':
+                    self.avgPeriod = settings.avgPeriod
+                elif settings.avgPeriod == 'season' and settings.season_source:
+                    if settings.season_source == 'proxy_metadata':
+                        self.avgPeriod = settings.avgPeriod+'META'
+                    elif settings.season_source == 'psm_calib':
+                        self.avgPeriod = settings.avgPeriod+'PSM'
                     else:
                         print('ERROR: unrecognized psm.season_source attribute!')
                         raise SystemExit()
                 else:
-                    self.avgPeriod = psm.avgPeriod
+                    self.avgPeriod = settings.avgPeriod
             except:
-                self.avgPeriod = psm.avgPeriod
-
+                self.avgPeriod = settings.avgPeriod
 
             if self.datadir_calib is None:
-                self.datadir_calib = join(lmr_path, 'data', 'analyses')
-            else:
-                self.datadir_calib = self.datadir_calib
+                self.datadir_calib = _cached_join(lmr_path, 'data', 'analyses')
 
             if self.pre_calib_datafile is None:
-                if '-'.join(proxies.use_from) == 'LMRdb':
-                    dbversion = proxies.LMRdb.dbversion
-                    filename = ('PSMs_' + '-'.join(proxies.use_from) +
-                                '_' + dbversion +
-                                '_' + self.avgPeriod +
-                                '_' + self.datatag_calib +
-                                '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                '.pckl')
-                else:
-                    filename = ('PSMs_' + '-'.join(proxies.use_from) +
-                                '_' + self.datatag_calib +
-                                '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                '.pckl')
-                self.pre_calib_datafile = join(lmr_path,
-                                               'PSM',
-                                               filename)
-            else:
-                self.pre_calib_datafile = self.pre_calib_datafile
+                self.pre_calib_datafile = _precalib_path(
+                    lmr_path, use_from_tag, settings.dbversion,
+                    self.avgPeriod, settings.anom_reference_period, settings.calib_period,
+                    self.datatag_calib)
 
             # association of calibration source and state variable needed to calculate Ye's
-            if self.datatag_calib in psm.all_calib_sources['temperature']:
+            if self.datatag_calib in settings.all_calib_sources['temperature']:
                 self.psm_required_variables = {'tas_sfc_Amon': 'anom'}
 
-            elif self.datatag_calib in psm.all_calib_sources['moisture']:
+            elif self.datatag_calib in settings.all_calib_sources['moisture']:
                 if self.datatag_calib == 'GPCC':
                     self.psm_required_variables = {'pr_sfc_Amon':'anom'}
                 elif self.datatag_calib == 'DaiPDSI':
@@ -1137,102 +1176,65 @@ class psm(ConfigGroup):
         
         ##** END User Parameters **##
 
-        def __init__(self, lmr_path=None, **kwargs):
+        def __init__(self, lmr_path=None, settings=None, **kwargs):
             super(self.__class__, self).__init__(**kwargs)
+            if settings is None:
+                settings = _PSMSettings()
 
-            self.datatag_calib_T = self.datatag_calib_T
             dataset_descr_T = _DataInfo.get_info(self.datatag_calib_T)
             self.datainfo_calib_T = dataset_descr_T['info']
             self.datadir_calib_T = dataset_descr_T['datadir']
             self.datafile_calib_T = dataset_descr_T['datafile']
             self.dataformat_calib_T = dataset_descr_T['dataformat']
 
-            
-            self.datatag_calib_P = self.datatag_calib_P
             dataset_descr_P = _DataInfo.get_info(self.datatag_calib_P)
             self.datainfo_calib_P = dataset_descr_P['info']
             self.datadir_calib_P = dataset_descr_P['datadir']
             self.datafile_calib_P = dataset_descr_P['datafile']
             self.dataformat_calib_P = dataset_descr_P['dataformat']
 
-            self.psm_r_crit = self.psm_r_crit
-            
-            if '-'.join(proxies.use_from) == 'PAGES2kv1' and 'season' in psm.avgPeriod:
+            use_from_tag = settings.use_from_tag
+            if use_from_tag == 'PAGES2kv1' and 'season' in settings.avgPeriod:
                 print('ERROR: Trying to use seasonality information with the PAGES2kv1 proxy records.')
                 print('       No seasonality metadata provided in that dataset. Exiting!')
                 print('       Change avgPeriod to "annual" in your configuration.')
                 raise SystemExit()
 
             try:
-                if psm.avgPeriod == 'annual':
-                    self.avgPeriod = psm.avgPeriod
-                elif psm.avgPeriod == 'season' and psm.season_source:
-                    if psm.season_source == 'proxy_metadata':
-                        self.avgPeriod = psm.avgPeriod+'META'
-                    elif psm.season_source == 'psm_calib':
-                        self.avgPeriod = psm.avgPeriod+'PSM'
+                if settings.avgPeriod == 'annual':
+                    self.avgPeriod = settings.avgPeriod
+                elif settings.avgPeriod == 'season' and settings.season_source:
+                    if settings.season_source == 'proxy_metadata':
+                        self.avgPeriod = settings.avgPeriod+'META'
+                    elif settings.season_source == 'psm_calib':
+                        self.avgPeriod = settings.avgPeriod+'PSM'
                     else:
                         print('ERROR: unrecognized psm.season_source attribute!')
                         raise SystemExit()
                 else:
-                    self.avgPeriod = psm.avgPeriod
+                    self.avgPeriod = settings.avgPeriod
             except:
-                self.avgPeriod = psm.avgPeriod
-
+                self.avgPeriod = settings.avgPeriod
 
             if lmr_path is None:
-                lmr_path = core.lmr_path
+                lmr_path = settings.lmr_path
 
             if self.datadir_calib_T is None:
-                self.datadir_calib_T = join(lmr_path, 'data', 'analyses')
+                self.datadir_calib_T = _cached_join(lmr_path, 'data', 'analyses')
             if self.datadir_calib_P is None:
-                self.datadir_calib_P = join(lmr_path, 'data', 'analyses')
+                self.datadir_calib_P = _cached_join(lmr_path, 'data', 'analyses')
                 
             if self.pre_calib_datafile_T is None:
-                if '-'.join(proxies.use_from) == 'LMRdb':
-                    dbversion = proxies.LMRdb.dbversion
-                    filename_t = ('PSMs_' + '-'.join(proxies.use_from) +
-                                  '_' + dbversion +
-                                  '_' + self.avgPeriod +
-                                  '_' + self.datatag_calib_T +
-                                  '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                  '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                  '.pckl')
-                else:
-                    filename_t = ('PSMs_' + '-'.join(proxies.use_from) +
-                                  '_' + self.datatag_calib_T +
-                                  '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                  '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                  '.pckl')
-                self.pre_calib_datafile_T = join(lmr_path,
-                                                 'PSM',
-                                                 filename_t)
-            else:
-                self.pre_calib_datafile_T = self.pre_calib_datafile_T
+                self.pre_calib_datafile_T = _precalib_path(
+                    lmr_path, use_from_tag, settings.dbversion,
+                    self.avgPeriod, settings.anom_reference_period, settings.calib_period,
+                    self.datatag_calib_T)
 
-
-                
             if self.pre_calib_datafile_P is None:
-                if '-'.join(proxies.use_from) == 'LMRdb':
-                    dbversion = proxies.LMRdb.dbversion
-                    filename_p = ('PSMs_' + '-'.join(proxies.use_from) +
-                                  '_' + dbversion +
-                                  '_' + self.avgPeriod +
-                                  '_' + self.datatag_calib_P +
-                                  '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                  '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                  '.pckl')
-                else:
-                    filename_p = ('PSMs_' + '-'.join(proxies.use_from) +
-                                  '_' + self.datatag_calib_P +
-                                  '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                  '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                  '.pckl')
-                self.pre_calib_datafile_P = join(lmr_path,
-                                                 'PSM',
-                                                 filename_p)
-            else:
-                self.pre_calib_datafile_P = self.pre_calib_datafile_P
+                self.pre_calib_datafile_P = _precalib_path(
+                    lmr_path, use_from_tag, settings.dbversion,
+                    self.avgPeriod, settings.anom_reference_period, settings.calib_period,
+                    self.datatag_calib_P)
 
             # association of calibration sources and state variables needed to calculate Ye's
             required_variables = {'tas_sfc_Amon': 'anom'} # start with temperature
@@ -1293,79 +1295,59 @@ class psm(ConfigGroup):
         
         ##** END User Parameters **##
 
-        def __init__(self, lmr_path=None, **kwargs):
+        def __init__(self, lmr_path=None, settings=None, **kwargs):
             super(self.__class__, self).__init__(**kwargs)
+            if settings is None:
+                settings = _PSMSettings()
 
-            self.datatag_calib_T = self.datatag_calib_T
             dataset_descr_T = _DataInfo.get_info(self.datatag_calib_T)
             self.datainfo_calib_T = dataset_descr_T['info']
             self.datadir_calib_T = dataset_descr_T['datadir']
             self.datafile_calib_T = dataset_descr_T['datafile']
             self.dataformat_calib_T = dataset_descr_T['dataformat']
 
-            self.datatag_calib_P = self.datatag_calib_P
             dataset_descr_P = _DataInfo.get_info(self.datatag_calib_P)
             self.datainfo_calib_P = dataset_descr_P['info']
             self.datadir_calib_P = dataset_descr_P['datadir']
             self.datafile_calib_P = dataset_descr_P['datafile']
             self.dataformat_calib_P = dataset_descr_P['dataformat']
 
-            self.psm_r_crit = self.psm_r_crit
-
-            if '-'.join(proxies.use_from) == 'PAGES2kv1' and 'season' in psm.avgPeriod:
+            use_from_tag = settings.use_from_tag
+            if use_from_tag == 'PAGES2kv1' and 'season' in settings.avgPeriod:
                 print('ERROR: Trying to use seasonality information with the PAGES2kv1 proxy records.')
                 print('       No seasonality metadata provided in that dataset. Exiting!')
                 print('       Change avgPeriod to "annual" in your configuration.')
                 raise SystemExit()
 
             try:
-                if psm.avgPeriod == 'annual':
-                    self.avgPeriod = psm.avgPeriod
-                elif psm.avgPeriod == 'season' and psm.season_source:
-                    if psm.season_source == 'proxy_metadata':
-                        self.avgPeriod = psm.avgPeriod+'META'
-                    elif psm.season_source == 'psm_calib':
-                        self.avgPeriod = psm.avgPeriod+'PSM'
+                if settings.avgPeriod == 'annual':
+                    self.avgPeriod = settings.avgPeriod
+                elif settings.avgPeriod == 'season' and settings.season_source:
+                    if settings.season_source == 'proxy_metadata':
+                        self.avgPeriod = settings.avgPeriod+'META'
+                    elif settings.season_source == 'psm_calib':
+                        self.avgPeriod = settings.avgPeriod+'PSM'
                     else:
                         print('ERROR: unrecognized psm.season_source attribute!')
                         raise SystemExit()
                 else:
-                    self.avgPeriod = psm.avgPeriod
+                    self.avgPeriod = settings.avgPeriod
             except:
-                self.avgPeriod = psm.avgPeriod
+                self.avgPeriod = settings.avgPeriod
 
-            
             if lmr_path is None:
-                lmr_path = core.lmr_path
+                lmr_path = settings.lmr_path
             
             if self.datadir_calib_T is None:
-                self.datadir_calib_T = join(lmr_path, 'data', 'analyses')
+                self.datadir_calib_T = _cached_join(lmr_path, 'data', 'analyses')
             if self.datadir_calib_P is None:
-                self.datadir_calib_P = join(lmr_path, 'data', 'analyses')
+                self.datadir_calib_P = _cached_join(lmr_path, 'data', 'analyses')
                 
             if self.pre_calib_datafile is None:
-                if '-'.join(proxies.use_from) == 'LMRdb':
-                    dbversion = proxies.LMRdb.dbversion
-                    filename = ('PSMs_'+'-'.join(proxies.use_from) +
-                                '_' + dbversion +
-                                '_' + self.avgPeriod +
-                                '_' + self.datatag_calib_T +
-                                '_' + self.datatag_calib_P +
-                                '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                '.pckl')
-                else:
-                    filename = ('PSMs_'+'-'.join(proxies.use_from) +
-                                '_' + self.datatag_calib_T +
-                                '_' + self.datatag_calib_P +
-                                '_ref' + str(core.anom_reference_period[0]) + '-' + str(core.anom_reference_period[1]) +
-                                '_cal' + str(psm.calib_period[0]) + '-' + str(psm.calib_period[1]) +
-                                '.pckl')
-                self.pre_calib_datafile = join(lmr_path,
-                                                 'PSM',
-                                                 filename)
-            else:
-                self.pre_calib_datafile = self.pre_calib_datafile
+                self.pre_calib_datafile = _precalib_path(
+                    lmr_path, use_from_tag, settings.dbversion,
+                    self.avgPeriod, settings.anom_reference_period, settings.calib_period,
+                    self.datatag_calib_T, self.datatag_calib_P)
 
             # association of calibration sources and state variables needed to calculate Ye's
             required_variables = {'tas_sfc_Amon': 'anom'} # start with temperature
@@ -1421,28 +1403,23 @@ class psm(ConfigGroup):
 
         ##** END User Parameters **##
 
-        def __init__(self, **kwargs):
+        def __init__(self, settings=None, **kwargs):
             super(self.__class__, self).__init__(**kwargs)
-
-            self.radius_influence = self.radius_influence
-            self.datadir_obsError = self.datadir_obsError
-            self.filename_obsError = self.filename_obsError
-            self.dataformat_obsError = self.dataformat_obsError 
+            if settings is None:
+                settings = _PSMSettings()
 
             if self.datafile_obsError is None:
-                self.datafile_obsError = join(self.datadir_obsError,
-                                              self.filename_obsError)
-            else:
-                self.datafile_obsError = self.datafile_obsError
+                self.datafile_obsError = _cached_join(self.datadir_obsError,
+                                                      self.filename_obsError)
 
             # define state variable needed to calculate Ye's
             # only d18O for now ...
 
             # psm requirements depend on settings in proxies class 
-            proxy_kind = proxies.proxy_timeseries_kind
-            if proxies.proxy_timeseries_kind == 'asis':
+            proxy_kind = settings.proxy_timeseries_kind
+            if settings.proxy_timeseries_kind == 'asis':
                 psm_var_kind = 'full'
-            elif proxies.proxy_timeseries_kind == 'anom':
+            elif settings.proxy_timeseries_kind == 'anom':
                 psm_var_kind = 'anom'
             else:
                 raise ValueError('Unrecognized proxy_timeseries_kind value in proxies class.'
@@ -1482,21 +1459,19 @@ class psm(ConfigGroup):
         
         ##** END User Parameters **##
 
-        def __init__(self, **kwargs):
+        def __init__(self, settings=None, **kwargs):
             super(self.__class__, self).__init__(**kwargs)
+            if settings is None:
+                settings = _PSMSettings()
 
             if self.datadir_BayesRegressionData is None:
-                self.datadir_BayesRegressionData = join(core.lmr_path, 'PSM')
-            else:
-                self.datadir_BayesRegressionData = self.datadir_BayesRegressionData
+                self.datadir_BayesRegressionData = _cached_join(settings.lmr_path, 'PSM')
             
             if self.filename_BayesRegressionData is None:
                 self.filename_BayesRegressionData = 'PSM_bayes_posterior_UK37.mat'
-            else:
-                self.filename_BayesRegressionData = self.filename_BayesRegressionData
 
-            self.datafile_BayesRegressionData = join(self.datadir_BayesRegressionData,
-                                              self.filename_BayesRegressionData)
+            self.datafile_BayesRegressionData = _cached_join(self.datadir_BayesRegressionData,
+                                                             self.filename_BayesRegressionData)
     
             # define state variable needed to calculate Ye's
             self.psm_required_variables = {'tos_sfc_Odec': 'full'}
@@ -1505,23 +1480,32 @@ class psm(ConfigGroup):
             # of the forward model.
             #self.MatlabEng = matlab.engine.start_matlab('-nojvm')
 
-            self.datadir_BayesRegressionData = self.datadir_BayesRegressionData
-            self.datafile_BayesRegressionData = self.datafile_BayesRegressionData
-            self.dataformat_BayesRegressionData = self.dataformat_BayesRegressionData
 
+    # Subclass instances are built on first access, an experiment typically
+    # only uses one or two PSM types
+    linear = _LazyPSM(linear)
+    linear_TorP = _LazyPSM(linear_TorP)
+    bilinear = _LazyPSM(bilinear)
+    h_interp = _LazyPSM(h_interp)
+    bayesreg_uk37 = _LazyPSM(bayesreg_uk37)
 
-    # Initialize subclasses with all attributes 
+    # Collect subclass arguments for the deferred initialization.  The
+    # subclass defaults and the settings they depend on are captured now so
+    # that a subclass built later matches the rest of this configuration.
     def __init__(self, lmr_path=None, **kwargs):
-        self.linear = self.linear(lmr_path=lmr_path, **kwargs.pop('linear', {}))
-        self.linear_TorP = self.linear_TorP(lmr_path=lmr_path,
-                                            **kwargs.pop('linear_TorP', {}))
-        self.bilinear = self.bilinear(lmr_path=lmr_path,
-                                      **kwargs.pop('bilinear', {}))
-        self.h_interp = self.h_interp(**kwargs.pop('h_interp', {}))
-        self.bayesreg_uk37 = self.bayesreg_uk37(**kwargs.pop('bayesreg_uk37', {}))
+        settings = _PSMSettings()
+        self._psm_kwargs = {}
+        for name in ('linear', 'linear_TorP', 'bilinear', 'h_interp',
+                     'bayesreg_uk37'):
+            psm_kwargs = deepcopy(getattr(psm, name)._class_params())
+            psm_kwargs.update(kwargs.pop(name, {}))
+            psm_kwargs['settings'] = settings
+            self._psm_kwargs[name] = psm_kwargs
+
+        for name in ('linear', 'linear_TorP', 'bilinear'):
+            self._psm_kwargs[name]['lmr_path'] = lmr_path
 
         super(self.__class__, self).__init__(**kwargs)
-        self.avgPeriod = self.avgPeriod
         self.all_calib_sources = deepcopy(self.all_calib_sources)
 
 
@@ -1663,22 +1647,22 @@ class prior(ConfigGroup):
     def __init__(self, lmr_path=None, seed=None, **kwargs):
         super(self.__class__, self).__init__(**kwargs)
 
-        self.prior_source = self.prior_source
-
         dataset_descr = _DataInfo.get_info(self.prior_source)
         self.datainfo_prior = dataset_descr['info']
         self.datadir_prior = dataset_descr['datadir']
         self.datafile_prior = dataset_descr['datafile']
         self.dataformat_prior = dataset_descr['dataformat']
 
-        self.state_variables = deepcopy(self.state_variables)
-        self.state_variables_info = deepcopy(self.state_variables_info)
-        self.detrend = self.detrend
-        self.regrid_method = self.regrid_method
+        # Kinds are plain strings and info entries flat lists of names, so a
+        # one-level copy is enough to keep instances independent
+        self.state_variables = dict(self.state_variables)
+        self.state_variables_info = {vtype: list(varnames)
+                                     for vtype, varnames
+                                     in self.state_variables_info.items()}
 
         # check if "anom" has been selected for any state variable
         # and set the anom_reference attribute accordingly
-        if any(self.state_variables[item] for item in self.state_variables.keys()):
+        if any(self.state_variables.values()):
             self.anom_reference = core.anom_reference_period
         else:
             self.anom_reference = None
@@ -1691,8 +1675,8 @@ class prior(ConfigGroup):
             lmr_path = core.lmr_path
 
         if self.datadir_prior is None:
-            self.datadir_prior = join(lmr_path, 'data', 'model',
-                                      self.prior_source)
+            self.datadir_prior = _cached_join(lmr_path, 'data', 'model',
+                                              self.prior_source)
 
         if core.recon_timescale == 1:
             self.avgInterval = {'annual': [1,2,3,4,5,6,7,8,9,10,11,12]} # annual (calendar) as default
@@ -1707,12 +1691,10 @@ class prior(ConfigGroup):
             self.regrid_resolution = int(self.regrid_resolution)
         elif self.regrid_method == 'esmpy':
             self.regrid_resolution = None
-            self.esmpy_interp_method = self.esmpy_interp_method
             self.esmpy_grid_def = _GridDef.get_info(self.esmpy_regrid_to)
         else:
             self.regrid_resolution = None
 
-        
         # Is variable requested in list of those specified as available?
         var_mismat = [varname for varname in self.state_variables
                       if varname not in self.datainfo_prior['available_vars']]
@@ -1728,6 +1710,9 @@ class Config(ConfigGroup):
     """
     An instanceable container for all the configuration objects.
     """
+
+    __slots__ = ('LEGACY_CONFIG', 'SRC_DIR', 'LOG_LEVEL',
+                 'wrapper', 'core', 'proxies', 'psm', 'prior')
     
     def __init__(self, **kwargs):
         self.LEGACY_CONFIG = LEGACY_CONFIG
@@ -1747,6 +1732,60 @@ class Config(ConfigGroup):
                            **kwargs.pop('prior', {}))
 
 
+# Config instances shared by get_config, keyed on the frozen keyword arguments
+_config_cache = {}
+
+
+def _freeze_kwargs(value):
+    """
+    Recursively convert a (possibly nested) keyword dictionary into a
+    hashable key for the config cache.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_kwargs(val))
+                            for key, val in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return (type(value),) + tuple(_freeze_kwargs(val) for val in value)
+    elif isinstance(value, set):
+        return frozenset(_freeze_kwargs(val) for val in value)
+    # Keep the type so that e.g. 1, 1.0 and True map to different keys
+    return (type(value), value)
+
+
+def get_config(**kwargs):
+    """
+    Return a Config instance for the given keyword arguments, building it
+    only on the first call with that set of arguments.
+
+    The returned object is shared between callers and should be treated as
+    read-only; use Config(**kwargs) directly for a private, modifiable copy.
+    Like any Config, it keeps the class defaults it was built with.  After
+    changing class attributes directly, call clear_config_cache() so that
+    later calls are built from the new defaults; update_config_class_yaml
+    does this when applied to the module or its classes.  Instances already
+    returned are not affected.
+
+    Parameters
+    ----------
+    kwargs:
+        Same nested dictionaries of parameter overrides accepted by Config
+    """
+    key = _freeze_kwargs(kwargs)
+    try:
+        return _config_cache[key]
+    except KeyError:
+        cfg = Config(**kwargs)
+        _config_cache[key] = cfg
+        return cfg
+
+
+def clear_config_cache():
+    """
+    Discard all Config instances shared by get_config.
+    """
+    _config_cache.clear()
+
+
 def is_config_class(obj):
     """
     Tests whether the input object is an instance of ConfigGroup
@@ -1801,6 +1840,12 @@ def update_config_class_yaml(yaml_dict, cfg_module):
     instance then please use keyword arguments during initialization.
     """
 
+    # Class defaults are about to change, so later get_config calls must not
+    # return instances built from the old ones.  Instance updates (keyword
+    # arguments at initialization) leave the class defaults alone.
+    if not isinstance(cfg_module, ConfigGroup):
+        clear_config_cache()
+
     for attr_name in list(yaml_dict.keys()):
         try:
             curr_cfg_obj = getattr(cfg_module, attr_name)
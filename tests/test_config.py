@@ -190,6 +190,116 @@ def test_config_update_with_kwarg():
     assert cfg.psm.linear.datatag_calib != 'BerkeleyEarth'
 
 
+# Test that instances keep the class defaults they were built with
+def test_instance_snapshots_class_defaults():
+    cfg_obj = cfg.Config()
+    orig_nens = cfg.core.nens
+
+    try:
+        cfg.core.nens = orig_nens + 1
+
+        assert cfg_obj.core.nens == orig_nens
+        assert cfg.Config().core.nens == orig_nens + 1
+    finally:
+        cfg.core.nens = orig_nens
+
+
+# Test that get_config shares instances built from identical kwargs
+def test_get_config_memoized():
+    cfg.clear_config_cache()
+    kwargs = {'wrapper': {'multi_seed': [1, 2, 3]},
+              'psm': {'linear': {'datatag_calib': 'BerkeleyEarth'}}}
+
+    cfg1 = cfg.get_config(**kwargs)
+    cfg2 = cfg.get_config(**deepcopy(kwargs))
+    assert cfg1 is cfg2
+    assert cfg.get_config() is cfg.get_config()
+    assert cfg.get_config() is not cfg1
+
+    # Equal but differently typed values are separate entries
+    assert (cfg.get_config(core={'seed': 1}) is not
+            cfg.get_config(core={'seed': True}))
+
+
+# Test that instance updates do not evict cached configurations
+def test_get_config_survives_instance_update():
+    cfg.clear_config_cache()
+    cfg1 = cfg.get_config()
+    cfg.Config(**{'core': {'nexp': 'other_exp'}})
+
+    assert cfg.get_config() is cfg1
+
+
+# Test that PSM subclasses are built on first access with their overrides
+def test_psm_lazy_construction():
+    kwargs = {'psm': {'linear': {'datatag_calib': 'BerkeleyEarth'},
+                      'bilinear': {'datatag_calib_T': 'MLOST'}}}
+    cfg_obj = cfg.Config(**kwargs)
+
+    assert 'linear' not in vars(cfg_obj.psm)
+    assert cfg_obj.psm.linear.datatag_calib == 'BerkeleyEarth'
+    assert cfg_obj.psm.linear is cfg_obj.psm.linear
+    assert cfg_obj.core.lmr_path in cfg_obj.psm.linear.datadir_calib
+
+    # Unused subclasses are never built
+    assert 'bilinear' not in vars(cfg_obj.psm)
+    assert 'h_interp' not in vars(cfg_obj.psm)
+
+    # The class attribute is still the nested configuration class
+    assert cfg.is_config_class(cfg.psm.linear)
+
+
+# Test that lazily built PSM subclasses use the defaults at Config() time
+def test_psm_lazy_construction_uses_build_time_defaults():
+    cfg_obj = cfg.Config()
+    orig_use_from = cfg.proxies.use_from
+    orig_calib = cfg.psm.linear.datatag_calib
+    orig_avg = cfg.psm.avgPeriod
+
+    try:
+        cfg.proxies.use_from = ['LMRdb']
+        cfg.psm.linear.datatag_calib = 'MLOST'
+        cfg.psm.avgPeriod = 'season'
+
+        assert cfg_obj.psm.linear.datatag_calib == orig_calib
+        assert cfg_obj.psm.linear.avgPeriod == orig_avg
+        assert 'LMRdb' not in cfg_obj.psm.linear.pre_calib_datafile
+        assert orig_calib in cfg_obj.psm.linear.pre_calib_datafile
+    finally:
+        cfg.proxies.use_from = orig_use_from
+        cfg.psm.linear.datatag_calib = orig_calib
+        cfg.psm.avgPeriod = orig_avg
+
+
+# Test that building a PSM subclass keeps its config in the get_config cache
+def test_psm_lazy_construction_keeps_cache():
+    cfg.clear_config_cache()
+    kwargs = {'psm': {'linear': {'datatag_calib': 'BerkeleyEarth'}}}
+    cfg1 = cfg.get_config(**kwargs)
+    cfg1.psm.linear
+
+    assert cfg.get_config(**kwargs) is cfg1
+
+
+# Test that updating the class defaults evicts cached configurations
+def test_get_config_cleared_by_class_update():
+    cfg.clear_config_cache()
+    cfg1 = cfg.get_config()
+    orig_nens = cfg.core.nens
+
+    try:
+        cfg.update_config_class_yaml({'core': {'nens': orig_nens + 1}}, cfg)
+
+        cfg2 = cfg.get_config()
+        assert cfg2 is not cfg1
+        assert cfg2.core.nens == orig_nens + 1
+        # Instances already handed out keep their values
+        assert cfg1.core.nens == orig_nens
+    finally:
+        cfg.core.nens = orig_nens
+        cfg.clear_config_cache()
+
+
 # DatasetDescriptor Tests #
 def test_datadescr_initialize():
     tmp = cfg._DatasetDescriptors()
@@ -28,7 +28,8 @@ import timeit
 import pandas as pd
 from time import time
 from os.path import join
-from copy import deepcopy
+from functools import lru_cache
+from types import MappingProxyType
 
 # LMR specific imports
 sys.path.append('../')
@@ -57,6 +58,67 @@ def roundup(x):
     return int(round(x,-n))
 
 
+# Config paths are joined from class-level constants: memoize so that every
+# instance shares the same path strings
+_cached_join = lru_cache(maxsize=None)(join)
+
+
+@lru_cache(maxsize=None)
+def _precalib_path(lmr_path, use_from, dbversion, avgPeriod, *datatags):
+    """
+    Absolute path to the file of pre-calibrated PSMs for the given proxy
+    databases (use_from, as a tuple) and calibration data tag(s).
+    dbversion is the NCDC database version, or None if NCDC is not used.
+    Memoized since all inputs are class-level constants of the config.
+    """
+    proxy_tag = '-'.join(use_from)
+    if dbversion is not None:
+        tags = (proxy_tag, dbversion, avgPeriod) + datatags
+    else:
+        tags = (proxy_tag,) + datatags
+    return join(lmr_path, 'PSM', 'PSMs_' + '_'.join(tags) + '.pckl')
+
+
+def _interned(strings):
+    """ Tuple of the interned strings, for cheap repeated comparisons. """
+    return tuple(sys.intern(s) for s in strings)
+
+
+def _frozen_proxy_assim(proxy_assim2):
+    """
+    Read-only version of a proxy_assim2 dictionary, with interned proxy
+    type keys and tuples of interned measurement tags as values.
+    """
+    return MappingProxyType({sys.intern(ptype): _interned(measurements)
+                             for ptype, measurements in proxy_assim2.items()})
+
+
+def _proxy_type_mapping(proxy_assim2):
+    """
+    Mapping of (proxy type, measurement) to the proxy type keys of
+    proxy_assim2, e.g. {('Tree ring', 'TRW'): 'Tree ring_Width'}.
+    """
+    mapping = {}
+    for ptype, measurements in proxy_assim2.items():
+        # Fetch proxy type name that occurs before underscore
+        type_name = sys.intern(ptype.split('_', 1)[0])
+        mapping.update({(type_name, measure): ptype
+                        for measure in measurements})
+    return mapping
+
+
+def _freeze_proxy_class(cls):
+    """
+    Convert the class-level parameters of a proxy database config class to
+    their immutable forms and build its proxy type mapping, once at import.
+    """
+    cls.proxy_assim2 = _frozen_proxy_assim(cls.proxy_assim2)
+    cls.proxy_order = _interned(cls.proxy_order)
+    cls.regions = _interned(cls.regions)
+    cls.proxy_blacklist = frozenset(cls.proxy_blacklist)
+    cls._PROXY_TYPE_MAPPING = _proxy_type_mapping(cls.proxy_assim2)
+
+
 
 # =============================================================================
 # START:  set user parameters here
@@ -84,6 +146,9 @@ class v_core(object):
         Whether to write the full eval python dictionary to output directory
     """
 
+    # Parameters are read from the class: instances need no storage
+    __slots__ = ()
+
     # -- production recons for paper 1
     #nexp = 'production_gis_ccsm4_pagesall_0.75/'
     #nexp = 'production_mlost_ccsm4_pagesall_0.75/'
@@ -117,16 +182,6 @@ class v_core(object):
     # Whether to write the full eval python dictionary to output directory ("summary" dict. has most of what we want)
     write_full_verif_dict = False
 
-
-    def __init__(self):
-        self.nexp = self.nexp
-        self.lmr_path = self.lmr_path
-        self.verif_period = self.verif_period
-        self.iter_range = self.iter_range
-        self.datadir_input = self.datadir_input
-        self.datadir_output = self.datadir_output
-        self.write_full_verif_dict = self.write_full_verif_dict
-
         
 class v_proxies(object):
     """
@@ -141,6 +196,8 @@ class v_proxies(object):
         Fraction of available proxy data (sites) to assimilate
     """
 
+    __slots__ = ('_kwargs', 'pages', 'ncdc')
+
     use_from = ['pages']
     #use_from = ['NCDC']
     proxy_frac = 1.0
@@ -169,25 +226,27 @@ class v_proxies(object):
             Absolute path to proxy meta data
         dataformat_proxy: str
             File format of the proxy data
-        regions: list(str)
-            List of proxy data regions (data keys) to use.
-        proxy_resolution: list(float)
-            List of proxy time resolutions to use
-        proxy_blacklist : list
+        regions: tuple(str)
+            Proxy data regions (data keys) to use.
+        proxy_resolution: tuple(float)
+            Proxy time resolutions to use
+        proxy_blacklist : frozenset
             A blacklist on proxy records, to eliminate specific records from
             processing
-        proxy_order: list(str):
+        proxy_order: tuple(str):
             Order of assimilation by proxy type key
         proxy_assim2: dict{ str: list(str)}
             Proxy types to be assimilated.
             Uses dictionary with structure {<<proxy type>>: [.. list of measuremant
             tags ..] where "proxy type" is written as
             "<<archive type>>_<<measurement type>>"
+            Frozen at import into a read-only mapping of tuples, with
+            interned strings.
         proxy_type_mapping: dict{(str,str): str}
             Maps proxy type and measurement to our proxy type keys.
             (e.g. {('Tree ring', 'TRW'): 'Tree ring_Width'} )
-        simple_filters: dict{'str': Iterable}
-            List mapping Pages2k metadata sheet columns to a list of values
+        simple_filters: dict{'str': frozenset}
+            Dict mapping Pages2k metadata sheet columns to a frozenset of values
             to filter by.
         """
 
@@ -196,14 +255,14 @@ class v_proxies(object):
         metafile_proxy = 'Pages2k_Metadata.df.pckl'
         dataformat_proxy = 'DF'
 
-        regions = ['Antarctica', 'Arctic', 'Asia', 'Australasia', 'Europe',
-                   'North America', 'South America']
+        regions = ('Antarctica', 'Arctic', 'Asia', 'Australasia', 'Europe',
+                   'North America', 'South America')
 
-        proxy_resolution = [1.0]
+        proxy_resolution = (1.0,)
 
         # DO NOT CHANGE FORMAT BELOW
 
-        proxy_order = [
+        proxy_order = (
             'Tree ring_Width',
             'Tree ring_Density',
             'Ice core_d18O',
@@ -214,7 +273,7 @@ class v_proxies(object):
             'Lake sediment_All',
             'Marine sediment_All',
             'Speleothem_All'
-        ]
+        )
 
         # Assignment of psm type per proxy type
         # Choices are: 'linear', 'linear_TorP', 'bilinear', 'h_interp'
@@ -262,41 +321,32 @@ class v_proxies(object):
             }
 
         # A blacklist on proxy records, to prevent assimilation of chronologies known to be duplicates
-        proxy_blacklist = []
+        proxy_blacklist = ()
 
 
         def __init__(self):
             if self.datadir_proxy is None:
-                self.datadir_proxy = join(v_core.lmr_path, 'data', 'proxies')
-            else:
-                self.datadir_proxy = self.datadir_proxy
+                self.datadir_proxy = _cached_join(v_core.lmr_path, 'data', 'proxies')
                 
-            self.datafile_proxy = join(self.datadir_proxy,
-                                       self.datafile_proxy)
-            self.metafile_proxy = join(self.datadir_proxy,
-                                       self.metafile_proxy)
-
-            self.dataformat_proxy = self.dataformat_proxy
-            self.regions = list(self.regions)
-            self.proxy_resolution = self.proxy_resolution
+            self.datafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.datafile_proxy)
+            self.metafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.metafile_proxy)
+
             self.proxy_timeseries_kind = v_proxies.proxy_timeseries_kind
-            self.proxy_order = list(self.proxy_order)
-            self.proxy_psm_type = deepcopy(self.proxy_psm_type)
-            self.proxy_assim2 = deepcopy(self.proxy_assim2)
-            self.proxy_blacklist = list(self.proxy_blacklist)
+            # flat str -> str dict: a shallow copy is a full copy
+            self.proxy_psm_type = dict(self.proxy_psm_type)
             self.proxy_availability_filter = v_proxies.proxy_availability_filter
             self.proxy_availability_fraction = v_proxies.proxy_availability_fraction
             
-            # Create mapping for Proxy Type/Measurement Type to type names above
-            self.proxy_type_mapping = {}
-            for type, measurements in self.proxy_assim2.items():
-                # Fetch proxy type name that occurs before underscore
-                type_name = type.split('_', 1)[0]
-                for measure in measurements:
-                    self.proxy_type_mapping[(type_name, measure)] = type
+            # Mapping for Proxy Type/Measurement Type to type names above,
+            # built once at import (see _proxy_type_mapping)
+            self.proxy_type_mapping = self._PROXY_TYPE_MAPPING
+
+            self.simple_filters = {'PAGES 2k Region': frozenset(self.regions),
+                                   'Resolution (yr)': frozenset(self.proxy_resolution)}
 
-            self.simple_filters = {'PAGES 2k Region': self.regions,
-                                   'Resolution (yr)': self.proxy_resolution}
+    _freeze_proxy_class(_pages)
 
 
     # ---------------
@@ -316,30 +366,32 @@ class v_proxies(object):
             Absolute path to proxy meta data
         dataformat_proxy: str
             File format of the proxy data
-        regions: list(str)
-            List of proxy data regions (data keys) to use.
-        proxy_resolution: list(float)
-            List of proxy time resolutions to use
-        proxy_blacklist : list
+        regions: tuple(str)
+            Proxy data regions (data keys) to use.
+        proxy_resolution: tuple(float)
+            Proxy time resolutions to use
+        proxy_blacklist : frozenset
             A blacklist on proxy records, to eliminate specific records from
             processing
-        database_filter: list(str)
-            List of databases from which to limit the selection of proxies.
-            Use [] (empty list) if no restriction, or ['db_name1', db_name2'] to limit to 
+        database_filter: tuple(str)
+            Databases from which to limit the selection of proxies.
+            Use () (empty tuple) if no restriction, or ('db_name1', db_name2') to limit to 
             proxies contained in "db_name1" OR "db_name2". 
             Possible choices are: 'PAGES1', 'PAGES2', 'LMR_FM'
-        proxy_order: list(str):
+        proxy_order: tuple(str):
             Order of assimilation by proxy type key
         proxy_assim2: dict{ str: list(str)}
             Proxy types to be assimilated.
             Uses dictionary with structure {<<proxy type>>: [.. list of measuremant
             tags ..] where "proxy type" is written as
             "<<archive type>>_<<measurement type>>"
+            Frozen at import into a read-only mapping of tuples, with
+            interned strings.
         proxy_type_mapping: dict{(str,str): str}
             Maps proxy type and measurement to our proxy type keys.
             (e.g. {('Tree ring', 'TRW'): 'Tree ring_Width'} )
-        simple_filters: dict{'str': Iterable}
-            List mapping proxy metadata sheet columns to a list of values
+        simple_filters: dict{'str': frozenset}
+            Dict mapping proxy metadata sheet columns to a frozenset of values
             to filter by.
         """
 
@@ -353,22 +405,22 @@ class v_proxies(object):
         dataformat_proxy = 'DF'
 
         # This is not activated with NCDC data yet...
-        regions = ['Antarctica', 'Arctic', 'Asia', 'Australasia', 'Europe',
-                   'North America', 'South America']
+        regions = ('Antarctica', 'Arctic', 'Asia', 'Australasia', 'Europe',
+                   'North America', 'South America')
 
-        proxy_resolution = [1.0]
+        proxy_resolution = (1.0,)
         
         # Limit proxies to those included in the following databases
-        database_filter = []
-        #database_filter = ['PAGES2kv2']
-        #database_filter = ['LMR','PAGES2kv2']
+        database_filter = ()
+        #database_filter = ('PAGES2kv2',)
+        #database_filter = ('LMR','PAGES2kv2')
 
         # A blacklist on proxy records, to prevent processing of chronologies known to be duplicates.
-        proxy_blacklist = []
+        proxy_blacklist = ()
 
         
         # DO NOT CHANGE FORMAT BELOW
-        proxy_order = [
+        proxy_order = (
         #    'Tree Rings_WidthPages',
             'Tree Rings_WidthPages2',
             'Tree Rings_WidthBreit',
@@ -388,7 +440,7 @@ class v_proxies(object):
             'Marine Cores_d18O',
 #            'Speleothems_d18O',
             'Bivalve_d18O',
-            ]
+            )
 
         # Assignment of psm type per proxy type
         # Choices are: 'linear', 'linear_TorP', 'bilinear', 'h_interp'
@@ -456,43 +508,59 @@ class v_proxies(object):
 
         def __init__(self):
             if self.datadir_proxy is None:
-                self.datadir_proxy = join(v_core.lmr_path, 'data', 'proxies')
-            else:
-                self.datadir_proxy = self.datadir_proxy
+                self.datadir_proxy = _cached_join(v_core.lmr_path, 'data', 'proxies')
 
-            self.datafile_proxy = join(self.datadir_proxy,
-                                       self.datafile_proxy)
-            self.metafile_proxy = join(self.datadir_proxy,
-                                       self.metafile_proxy)
+            self.datafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.datafile_proxy)
+            self.metafile_proxy = _cached_join(self.datadir_proxy,
+                                               self.metafile_proxy)
 
-            self.dataformat_proxy = self.dataformat_proxy
-            self.regions = list(self.regions)
-            self.proxy_resolution = self.proxy_resolution
             self.proxy_timeseries_kind = v_proxies.proxy_timeseries_kind
-            self.proxy_order = list(self.proxy_order)
-            self.proxy_psm_type = deepcopy(self.proxy_psm_type)
-            self.proxy_assim2 = deepcopy(self.proxy_assim2)
-            self.database_filter = list(self.database_filter)
-            self.proxy_blacklist = list(self.proxy_blacklist)
+            # flat str -> str dict: a shallow copy is a full copy
+            self.proxy_psm_type = dict(self.proxy_psm_type)
             self.proxy_availability_filter = v_proxies.proxy_availability_filter
             self.proxy_availability_fraction = v_proxies.proxy_availability_fraction
             
-            self.proxy_type_mapping = {}
-            for ptype, measurements in self.proxy_assim2.items():
-                # Fetch proxy type name that occurs before underscore
-                type_name = ptype.split('_', 1)[0]
-                for measure in measurements:
-                    self.proxy_type_mapping[(type_name, measure)] = ptype
+            self.proxy_type_mapping = self._PROXY_TYPE_MAPPING
 
-            self.simple_filters = {'Resolution (yr)': self.proxy_resolution}
+            self.simple_filters = {'Resolution (yr)': frozenset(self.proxy_resolution)}
 
+    _freeze_proxy_class(_ncdc)
 
-    # Initialize subclasses with all attributes
+
+    @classmethod
+    def _is_ncdc(cls):
+        # True when the NCDC database is the only proxy source
+        return list(cls.use_from) == ['NCDC']
+
+    @classmethod
+    def _precalib_tags(cls):
+        # use_from (as a tuple) and the NCDC database version, or None if
+        # NCDC is not used, as needed by _precalib_path
+        if cls._is_ncdc():
+            dbversion = cls._ncdc.dbversion
+        else:
+            dbversion = None
+        return tuple(cls.use_from), dbversion
+
+    # Subclasses are initialized on first access (see __getattr__), so only
+    # the database(s) in use_from are ever built
     def __init__(self, **kwargs):
-        self.use_from = self.use_from
-        self.proxy_frac = self.proxy_frac
-        self.pages = self._pages(**kwargs)
-        self.ncdc = self._ncdc(**kwargs)
+        self._kwargs = kwargs
+
+    def __getattr__(self, name):
+        # Only called when regular attribute lookup fails, i.e. while the
+        # pages/ncdc slot is still empty
+        if name == 'pages':
+            subclass = self._pages
+        elif name == 'ncdc':
+            subclass = self._ncdc
+        else:
+            raise AttributeError(name)
+
+        value = subclass(**self._kwargs)
+        setattr(self, name, value)
+        return value
 
 
 
@@ -506,6 +574,8 @@ class v_psm(object):
         Indicates use of PSMs calibrated on annual or seasonal data: allowed tags are 'annual' or 'season'
     """
 
+    __slots__ = ('linear', 'linear_TorP', 'bilinear', 'h_interp')
+
     # Keep this as annual, as it is assumed that LMR output is annual
     avgPeriod = 'annual'
     
@@ -563,31 +633,16 @@ class v_psm(object):
 
 
         def __init__(self):
-            self.datatag_calib = self.datatag_calib
-            self.datafile_calib = self.datafile_calib
-            self.psm_r_crit = self.psm_r_crit
             self.avgPeriod = v_psm.avgPeriod
             
             if self.datadir_calib is None:
-                self.datadir_calib = join(v_core.lmr_path, 'data', 'analyses')
-            else:
-                self.datadir_calib = self.datadir_calib
+                self.datadir_calib = _cached_join(v_core.lmr_path, 'data', 'analyses')
 
             if self.pre_calib_datafile is None:
-                if '-'.join(v_proxies.use_from) == 'NCDC':
-                    dbversion = v_proxies._ncdc.dbversion
-                    filename = ('PSMs_'+'-'.join(v_proxies.use_from) +
-                                '_' + dbversion +
-                                '_' + self.avgPeriod +
-                                '_' + self.datatag_calib+'.pckl')
-                else:
-                    filename = ('PSMs_' + '-'.join(v_proxies.use_from) +
-                                '_' + self.datatag_calib+'.pckl')
-                self.pre_calib_datafile = join(v_core.lmr_path,
-                                               'PSM',
-                                               filename)
-            else:
-                self.pre_calib_datafile = self.pre_calib_datafile
+                use_from, dbversion = v_proxies._precalib_tags()
+                self.pre_calib_datafile = _precalib_path(
+                    v_core.lmr_path, use_from, dbversion, self.avgPeriod,
+                    self.datatag_calib)
 
 
             # association of calibration source and state variable needed to calculate Ye's
@@ -674,50 +729,22 @@ class v_psm(object):
         psm_r_crit = 0.0
 
         def __init__(self):
-            self.datatag_calib_T = self.datatag_calib_T
-            self.datafile_calib_T = self.datafile_calib_T
-            self.datatag_calib_P = self.datatag_calib_P
-            self.datafile_calib_P = self.datafile_calib_P
-            self.dataformat_calib = self.dataformat_calib
-            self.psm_r_crit = self.psm_r_crit
             self.avgPeriod = v_psm.avgPeriod
             
             if self.datadir_calib is None:
-                self.datadir_calib = join(v_core.lmr_path, 'data', 'analyses')
-            else:
-                self.datadir_calib = self.datadir_calib
+                self.datadir_calib = _cached_join(v_core.lmr_path, 'data', 'analyses')
+
+            use_from, dbversion = v_proxies._precalib_tags()
 
             if self.pre_calib_datafile_T is None:
-                if '-'.join(v_proxies.use_from) == 'NCDC':
-                    dbversion = v_proxies._ncdc.dbversion
-                    filename_t = ('PSMs_' + '-'.join(v_proxies.use_from) +
-                                  '_' + dbversion +
-                                  '_' + self.avgPeriod +
-                                  '_' + self.datatag_calib_T + '.pckl')
-                else:
-                    filename_t = ('PSMs_' + '-'.join(v_proxies.use_from) +
-                                  '_' + self.datatag_calib_T + '.pckl')
-                self.pre_calib_datafile_T = join(v_core.lmr_path,
-                                                 'PSM',
-                                                 filename_t)
-            else:
-                self.pre_calib_datafile_T = self.pre_calib_datafile_T
+                self.pre_calib_datafile_T = _precalib_path(
+                    v_core.lmr_path, use_from, dbversion, self.avgPeriod,
+                    self.datatag_calib_T)
 
             if self.pre_calib_datafile_P is None:
-                if '-'.join(v_proxies.use_from) == 'NCDC':
-                    dbversion = v_proxies._ncdc.dbversion
-                    filename_p = ('PSMs_' + '-'.join(v_proxies.use_from) +
-                                  '_' + dbversion +
-                                  '_' + self.avgPeriod +
-                                  '_' + self.datatag_calib_P + '.pckl')
-                else:
-                    filename_p = ('PSMs_' + '-'.join(v_proxies.use_from) +
-                                  '_' + self.datatag_calib_P + '.pckl')
-                self.pre_calib_datafile_P = join(v_core.lmr_path,
-                                                 'PSM',
-                                                 filename_p)
-            else:
-                self.pre_calib_datafile_P = self.pre_calib_datafile_P
+                self.pre_calib_datafile_P = _precalib_path(
+                    v_core.lmr_path, use_from, dbversion, self.avgPeriod,
+                    self.datatag_calib_P)
 
 
             # association of calibration sources and state variables needed to calculate Ye's
@@ -796,36 +823,17 @@ class v_psm(object):
          
 
         def __init__(self):
-            self.datatag_calib_T = self.datatag_calib_T
-            self.datafile_calib_T = self.datafile_calib_T
-            self.datatag_calib_P = self.datatag_calib_P
-            self.datafile_calib_P = self.datafile_calib_P
-            self.psm_r_crit = self.psm_r_crit
             self.avgPeriod = v_psm.avgPeriod
             
             if self.datadir_calib is None:
-                self.datadir_calib = join(v_core.lmr_path, 'data', 'analyses')
-            else:
-                self.datadir_calib = self.datadir_calib
+                self.datadir_calib = _cached_join(v_core.lmr_path, 'data', 'analyses')
 
 
             if self.pre_calib_datafile is None:
-                if '-'.join(v_proxies.use_from) == 'NCDC':
-                    dbversion = v_proxies._ncdc.dbversion
-                    filename = ('PSMs_'+'-'.join(v_proxies.use_from) +
-                                '_' + dbversion +
-                                '_' + self.avgPeriod +
-                                '_' + self.datatag_calib_T +
-                                '_' + self.datatag_calib_P +'.pckl')
-                else:
-                    filename = ('PSMs_'+'-'.join(v_proxies.use_from) +
-                                '_' + self.datatag_calib_T +
-                                '_' + self.datatag_calib_P +'.pckl')
-                self.pre_calib_datafile = join(v_core.lmr_path,
-                                               'PSM',
-                                               filename)
-            else:
-                self.pre_calib_datafile = self.pre_calib_datafile
+                use_from, dbversion = v_proxies._precalib_tags()
+                self.pre_calib_datafile = _precalib_path(
+                    v_core.lmr_path, use_from, dbversion, self.avgPeriod,
+                    self.datatag_calib_T, self.datatag_calib_P)
 
             # association of calibration sources and state variables needed to calculate Ye's
             required_variables = {'tas_sfc_Amon': 'anom'} # start with temperature
@@ -863,6 +871,8 @@ class v_psm(object):
             Absolute path/filename of obs. error variance data
         """
 
+        __slots__ = ('datafile_obsError', 'psm_required_variables')
+
         ##** BEGIN User Parameters **##
 
         # Interpolation parameter:
@@ -876,7 +886,6 @@ class v_psm(object):
         ##** END User Parameters **##
 
         def __init__(self):
-            self.radius_influence = self.radius_influence
             # File with R values not required in context of this program.
             self.datafile_obsError = None
                 
@@ -906,12 +915,23 @@ class v_psm(object):
 # END:  set user parameters here
 # =============================================================================
 class config(object):
+    __slots__ = ('core', 'proxies', 'psm')
+
     def __init__(self,core,proxies,psm):
         self.core = core()
         self.proxies = proxies()
         self.psm = psm()
 
-Cfg = config(v_core,v_proxies,v_psm)
+
+@lru_cache(maxsize=None)
+def get_config(core=v_core, proxies=v_proxies, psm=v_psm):
+    """
+    Shared config instance for the given parameter classes, built only once
+    per distinct set of classes. Treat the returned object as read-only.
+    """
+    return config(core, proxies, psm)
+
+Cfg = get_config()
 
 
 # =============================================================================
@@ -992,7 +1012,7 @@ def main():
     psm_keys = list(set([proxy_cfg.proxy_psm_type[p] for p in proxy_types]))
 
     # Forming list of required state variables
-    psmclasses = dict([(name,cls)  for name, cls in list(Cfg.psm.__dict__.items())])
+    psmclasses = dict([(name, getattr(Cfg.psm, name)) for name in psm_keys])
     psm_required_variables = []
     calib_sources = []
     for psm_type in psm_keys: